@@ -45,16 +45,8 @@ export default async function handler(req, res) {
       return res.status(401).json({ error: 'Unauthorized' });
     }
 
-    // 2. Check subscription tier (agents = premium feature)
-    const subscription = await getUserSubscription(user.id);
-    if (!subscription || !subscription.features?.includes('ai_agents')) {
-      return res.status(403).json({
-        error: 'AI-Enhanced features require a Pro subscription',
-        upgradeUrl: '/subscription.html'
-      });
-    }
-
-    // 3. Validate request payload
+    // 2. Validate request payload before touching the database - a
+    // malformed request should fail fast without subscription/usage queries
     const { agentType, action, data, options } = req.body;
 
     if (!agentType || !action || !data) {
@@ -71,8 +63,23 @@ export default async function handler(req, res) {
       });
     }
 
+    // 3. Check subscription tier and monthly usage. The two queries are
+    // independent (usage count does not depend on tier), so run them
+    // concurrently instead of paying two sequential round trips.
+    const [subscription, monthlyUsage] = await Promise.all([
+      getUserSubscription(user.id),
+      getMonthlyUsageCount(user.id)
+    ]);
+
+    if (!subscription || !subscription.features?.includes('ai_agents')) {
+      return res.status(403).json({
+        error: 'AI-Enhanced features require a Pro subscription',
+        upgradeUrl: '/subscription.html'
+      });
+    }
+
     // 4. Check rate limits
-    const rateLimitOk = await checkRateLimit(user.id, subscription.tier);
+    const rateLimitOk = checkRateLimit(monthlyUsage, subscription.tier);
     if (!rateLimitOk) {
       return res.status(429).json({
         error: 'Agent invocation limit reached for your subscription tier',
@@ -176,18 +183,10 @@ async function getUserSubscription(userId) {
 }
 
 /**
- * Check rate limits based on subscription tier
+ * Get agent invocation count for the current month
+ * Returns null if the count could not be retrieved
  */
-async function checkRateLimit(userId, tier) {
-  const limits = {
-    free: 5,      // 5 invocations per month
-    pro: 50,      // 50 invocations per month
-    enterprise: 999999 // Unlimited
-  };
-
-  const limit = limits[tier] || limits.free;
-
-  // Get usage count for current month
+async function getMonthlyUsageCount(userId) {
   const startOfMonth = new Date();
   startOfMonth.setDate(1);
   startOfMonth.setHours(0, 0, 0, 0);
@@ -200,10 +199,29 @@ async function checkRateLimit(userId, tier) {
 
   if (error) {
     console.error('Rate limit check error:', error);
+    return null;
+  }
+
+  return count;
+}
+
+/**
+ * Check rate limits based on subscription tier
+ */
+function checkRateLimit(monthlyUsage, tier) {
+  const limits = {
+    free: 5,      // 5 invocations per month
+    pro: 50,      // 50 invocations per month
+    enterprise: 999999 // Unlimited
+  };
+
+  const limit = limits[tier] || limits.free;
+
+  if (monthlyUsage === null) {
     return true; // Fail open
   }
 
-  return count < limit;
+  return monthlyUsage < limit;
 }
 
 /**
@@ -278,16 +296,21 @@ async function calculateLCAWithAgent(data, options) {
 
   // TODO: Invoke actual Claude Code agent via API
   // For now, return structured placeholder
+  // Walk the materials list exactly once - intensity and the stage
+  // breakdown are both straight derivations of the same total
+  const totalCarbon = calculateTotalCarbon(materials);
+  const intensity = totalCarbon / projectInfo.gfa;
+
   return {
-    totalEmbodiedCarbon: calculateTotalCarbon(materials),
-    carbonIntensity: calculateCarbonIntensity(materials, projectInfo.gfa),
-    stages: calculateLCAStages(materials),
+    totalEmbodiedCarbon: totalCarbon,
+    carbonIntensity: intensity,
+    stages: calculateLCAStages(materials, totalCarbon),
     hotspots: identifyHotspots(materials),
     recommendations: generateRecommendations(materials),
     compliance: {
-      ncc: checkNCC(projectInfo, materials),
-      nabers: calculateNABERS(materials, projectInfo.gfa),
-      greenStar: calculateGreenStar(materials, projectInfo.gfa)
+      ncc: checkNCC(intensity),
+      nabers: calculateNABERS(intensity),
+      greenStar: calculateGreenStar(intensity, projectInfo.gfa)
     }
   };
 }
@@ -473,8 +496,8 @@ function calculateCarbonIntensity(materials, gfa) {
   return calculateTotalCarbon(materials) / gfa;
 }
 
-function calculateLCAStages(materials) {
-  const total = calculateTotalCarbon(materials);
+function calculateLCAStages(materials, precomputedTotal) {
+  const total = precomputedTotal !== undefined ? precomputedTotal : calculateTotalCarbon(materials);
   return {
     a1a3: total * 0.70,
     a4: total * 0.05,
@@ -504,8 +527,7 @@ function generateRecommendations(materials) {
   ];
 }
 
-function checkNCC(projectInfo, materials) {
-  const intensity = calculateCarbonIntensity(materials, projectInfo.gfa);
+function checkNCC(intensity) {
   return {
     pass: intensity < 450,
     benchmark: 450,
@@ -513,8 +535,7 @@ function checkNCC(projectInfo, materials) {
   };
 }
 
-function calculateNABERS(materials, gfa) {
-  const intensity = calculateCarbonIntensity(materials, gfa);
+function calculateNABERS(intensity) {
   return {
     rating: calculateNABERSRating(intensity),
     threshold: 500
@@ -530,8 +551,7 @@ function calculateNABERSRating(intensity) {
   return 1;
 }
 
-function calculateGreenStar(materials, gfa) {
-  const intensity = calculateCarbonIntensity(materials, gfa);
+function calculateGreenStar(intensity, gfa) {
   return {
     points: calculateGreenStarPoints(intensity, gfa),
     certification: getGreenStarCertification(intensity, gfa)
@@ -55,6 +55,10 @@ const AGENT_CONFIGS = {
   },
 };
 
+// Prompt files are static for the lifetime of a deployment, so cache them
+// per agent type. Warm invocations skip the synchronous disk read entirely.
+const promptCache = new Map();
+
 /**
  * Load agent prompt from .claude/agents/ directory
  * @param {string} agentType - The agent type identifier
@@ -66,9 +70,15 @@ function loadAgentPrompt(agentType) {
     throw new Error(`Unknown agent type: ${agentType}`);
   }
 
+  const cached = promptCache.get(agentType);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   try {
     const promptPath = join(process.cwd(), '.claude', 'agents', agentConfig.promptFile);
     const promptContent = readFileSync(promptPath, 'utf-8');
+    promptCache.set(agentType, promptContent);
     return promptContent;
   } catch (error) {
     console.error(`Failed to load agent prompt for ${agentType}:`, error);
@@ -102,6 +112,11 @@ ${options.instructions ? `SPECIAL INSTRUCTIONS:\n${options.instructions}\n` : ''
 Please respond with a valid JSON object containing the results, followed by any markdown explanation.`;
 }
 
+// Compiled once at module load; matches the JSON object embedded in the
+// agent's text response. Building the regex inside parseAgentResponse would
+// re-parse the pattern on every invocation.
+const JSON_BLOCK_PATTERN = /\{[\s\S]*\}/;
+
 /**
  * Parse Claude's response and extract JSON + markdown
  * @param {object} response - The Anthropic API response
@@ -118,15 +133,18 @@ function parseAgentResponse(response) {
     .join('\n');
 
   // Try to extract JSON from the response
-  const jsonMatch = textContent.match(/\{[\s\S]*\}/);
+  const jsonMatch = textContent.match(JSON_BLOCK_PATTERN);
   let parsedData = null;
   let explanation = textContent;
 
   if (jsonMatch) {
     try {
       parsedData = JSON.parse(jsonMatch[0]);
-      // Remove JSON from explanation
-      explanation = textContent.replace(jsonMatch[0], '').trim();
+      // Remove JSON from explanation. match() already found the block's
+      // position, so slice around it rather than re-searching the whole
+      // text with replace().
+      explanation = (textContent.slice(0, jsonMatch.index) +
+        textContent.slice(jsonMatch.index + jsonMatch[0].length)).trim();
     } catch (error) {
       console.warn('Failed to parse JSON from response:', error);
       // Continue with text-only response
@@ -192,8 +210,10 @@ export async function invokeAgent(agentType, action, data, options = {}) {
 
     console.log(`[Claude API] Invoking ${agentType} with action: ${action}`);
 
-    // Call Claude API
-    const response = await anthropic.messages.create({
+    // Call Claude API using the streaming endpoint. Tokens accumulate as
+    // they are generated instead of buffering the whole response, and long
+    // generations avoid the non-streaming request timeout.
+    const stream = anthropic.messages.stream({
       model: agentConfig.model,
       max_tokens: agentConfig.maxTokens,
       temperature: CONFIG.temperature,
@@ -203,6 +223,7 @@ export async function invokeAgent(agentType, action, data, options = {}) {
         content: userMessage,
       }],
     });
+    const response = await stream.finalMessage();
 
     // Parse response
     const parsedResponse = parseAgentResponse(response);
@@ -401,15 +401,17 @@ class AgentOrchestrator {
    */
   async parseRBSSFile(file) {
     const content = await this.readFileAsText(file);
-    // Simple CSV parser (expand as needed)
+    // Simple CSV parser (expand as needed). Trim headers once up front
+    // rather than re-trimming them for every row of the extract.
     const lines = content.split('\n');
-    const headers = lines[0].split(',');
+    const headers = lines[0].split(',').map(header => header.trim());
     return lines.slice(1).map(line => {
       const values = line.split(',');
-      return headers.reduce((obj, header, i) => {
-        obj[header.trim()] = values[i]?.trim();
-        return obj;
-      }, {});
+      const row = {};
+      for (let i = 0; i < headers.length; i++) {
+        row[headers[i]] = values[i]?.trim();
+      }
+      return row;
     });
   }
 
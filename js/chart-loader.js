@@ -9,6 +9,13 @@
  *   const chart = ChartLoader.createChart(ctx, config);
  */
 
+// Overlay styling for the chart loading indicator - one cssText parse per
+// loader instead of eight individual style property assignments
+const CHART_LOADER_CSS =
+    'position:absolute;top:0;left:0;right:0;bottom:0;' +
+    'background-color:rgba(255,255,255,0.9);display:flex;' +
+    'align-items:center;justify-content:center;';
+
 class ChartJSLoader {
     constructor() {
         this.loaded = false;
@@ -231,15 +238,7 @@ class ChartJSLoader {
                 <span class="ml-3 text-brand-steel">Loading chart...</span>
             </div>
         `;
-        loader.style.position = 'absolute';
-        loader.style.top = '0';
-        loader.style.left = '0';
-        loader.style.right = '0';
-        loader.style.bottom = '0';
-        loader.style.backgroundColor = 'rgba(255, 255, 255, 0.9)';
-        loader.style.display = 'flex';
-        loader.style.alignItems = 'center';
-        loader.style.justifyContent = 'center';
+        loader.style.cssText = CHART_LOADER_CSS;
 
         container.style.position = 'relative';
         container.appendChild(loader);
@@ -28,6 +28,25 @@ class ChartsManager {
             scope2: '#14b8a6',
             scope3: '#6366f1'
         };
+
+        // Shared static option fragments. Charts are destroyed and rebuilt
+        // on every recalculation, so build these once instead of allocating
+        // identical font/title literals per rebuild.
+        this.titleFont = { size: 16, weight: 'bold', family: 'Inter' };
+        this.axisTitleFont = { size: 12, family: 'Inter' };
+        this.tickFont = { size: 11, family: 'Inter' };
+    }
+
+    /**
+     * Helper: Standard chart title block
+     */
+    chartTitle(text) {
+        return {
+            display: true,
+            text: text,
+            font: this.titleFont,
+            padding: 20
+        };
     }
 
     /**
@@ -64,6 +83,10 @@ class ChartsManager {
             }]
         };
 
+        // Total is fixed for the lifetime of the chart; computing it here
+        // avoids re-summing the dataset on every tooltip render
+        const total = data.datasets[0].data.reduce((a, b) => a + b, 0);
+
         this.charts[canvasId] = new Chart(ctx, {
             type: 'doughnut',
             data: data,
@@ -81,22 +104,12 @@ class ChartsManager {
                             }
                         }
                     },
-                    title: {
-                        display: true,
-                        text: 'Life Cycle Assessment Breakdown',
-                        font: {
-                            size: 16,
-                            weight: 'bold',
-                            family: 'Inter'
-                        },
-                        padding: 20
-                    },
+                    title: this.chartTitle('Life Cycle Assessment Breakdown'),
                     tooltip: {
                         callbacks: {
                             label: function(context) {
                                 const label = context.label || '';
                                 const value = context.parsed || 0;
-                                const total = context.dataset.data.reduce((a, b) => a + b, 0);
                                 const percentage = total > 0 ? ((value / total) * 100).toFixed(1) : 0;
                                 return `${label}: ${value.toLocaleString()} kg CO2-e (${percentage}%)`;
                             }
@@ -142,6 +155,8 @@ class ChartsManager {
             }]
         };
 
+        const total = data.datasets[0].data.reduce((a, b) => a + b, 0);
+
         this.charts[canvasId] = new Chart(ctx, {
             type: 'bar',
             data: data,
@@ -152,21 +167,11 @@ class ChartsManager {
                     legend: {
                         display: false
                     },
-                    title: {
-                        display: true,
-                        text: 'GHG Protocol Scopes Breakdown',
-                        font: {
-                            size: 16,
-                            weight: 'bold',
-                            family: 'Inter'
-                        },
-                        padding: 20
-                    },
+                    title: this.chartTitle('GHG Protocol Scopes Breakdown'),
                     tooltip: {
                         callbacks: {
                             label: function(context) {
                                 const value = context.parsed.y || 0;
-                                const total = context.dataset.data.reduce((a, b) => a + b, 0);
                                 const percentage = total > 0 ? ((value / total) * 100).toFixed(1) : 0;
                                 return `${value.toLocaleString()} kg CO2-e (${percentage}%)`;
                             }
@@ -179,10 +184,7 @@ class ChartsManager {
                         title: {
                             display: true,
                             text: 'Carbon Emissions (kg CO2-e)',
-                            font: {
-                                size: 12,
-                                family: 'Inter'
-                            }
+                            font: this.axisTitleFont
                         },
                         ticks: {
                             callback: function(value) {
@@ -192,10 +194,7 @@ class ChartsManager {
                     },
                     x: {
                         ticks: {
-                            font: {
-                                size: 11,
-                                family: 'Inter'
-                            }
+                            font: this.tickFont
                         }
                     }
                 }
@@ -227,8 +226,16 @@ class ChartsManager {
         const sortedCategories = Object.entries(categories)
             .sort((a, b) => b[1] - a[1]);
 
-        const labels = sortedCategories.map(([cat]) => this.formatCategoryName(cat));
-        const data = sortedCategories.map(([, emissions]) => emissions);
+        // Build the parallel label/data arrays (and the tooltip total) in
+        // one walk instead of two maps plus a reduce
+        const labels = [];
+        const data = [];
+        let total = 0;
+        sortedCategories.forEach(([cat, emissions]) => {
+            labels.push(this.formatCategoryName(cat));
+            data.push(emissions);
+            total += emissions;
+        });
         const colors = this.generateColors(sortedCategories.length);
 
         this.charts[canvasId] = new Chart(ctx, {
@@ -251,21 +258,11 @@ class ChartsManager {
                     legend: {
                         display: false
                     },
-                    title: {
-                        display: true,
-                        text: 'Carbon Emissions by Material Category',
-                        font: {
-                            size: 16,
-                            weight: 'bold',
-                            family: 'Inter'
-                        },
-                        padding: 20
-                    },
+                    title: this.chartTitle('Carbon Emissions by Material Category'),
                     tooltip: {
                         callbacks: {
                             label: function(context) {
                                 const value = context.parsed.x || 0;
-                                const total = context.dataset.data.reduce((a, b) => a + b, 0);
                                 const percentage = total > 0 ? ((value / total) * 100).toFixed(1) : 0;
                                 return `${value.toLocaleString()} kg CO2-e (${percentage}%)`;
                             }
@@ -278,10 +275,7 @@ class ChartsManager {
                         title: {
                             display: true,
                             text: 'Carbon Emissions (kg CO2-e)',
-                            font: {
-                                size: 12,
-                                family: 'Inter'
-                            }
+                            font: this.axisTitleFont
                         },
                         ticks: {
                             callback: function(value) {
@@ -291,10 +285,7 @@ class ChartsManager {
                     },
                     y: {
                         ticks: {
-                            font: {
-                                size: 11,
-                                family: 'Inter'
-                            }
+                            font: this.tickFont
                         }
                     }
                 }
@@ -338,16 +329,7 @@ class ChartsManager {
                     legend: {
                         display: false
                     },
-                    title: {
-                        display: true,
-                        text: 'Industry Benchmarking',
-                        font: {
-                            size: 16,
-                            weight: 'bold',
-                            family: 'Inter'
-                        },
-                        padding: 20
-                    },
+                    title: this.chartTitle('Industry Benchmarking'),
                     tooltip: {
                         callbacks: {
                             label: function(context) {
@@ -362,10 +344,7 @@ class ChartsManager {
                         title: {
                             display: true,
                             text: 'Carbon Intensity (kg CO2-e/m²)',
-                            font: {
-                                size: 12,
-                                family: 'Inter'
-                            }
+                            font: this.axisTitleFont
                         }
                     }
                 }
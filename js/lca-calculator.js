@@ -73,6 +73,25 @@ class LCACalculator {
             finishes: 0.08       // Moderate - varies by material
         };
         
+        // Recycling rates and benefits for Australian context
+        this.recyclingPotential = {
+            concrete: { rate: 0.80, benefit: 0.05 },  // 80% can be crushed to aggregate
+            steel: { rate: 0.95, benefit: 0.70 },     // 95% recyclable, high benefit
+            timber: { rate: 0.40, benefit: 0.20 },    // Can be reused or chipped
+            masonry: { rate: 0.60, benefit: 0.05 },   // Can be crushed
+            insulation: { rate: 0.20, benefit: 0.10 }, // Limited recycling
+            glazing: { rate: 0.70, benefit: 0.30 },    // Glass is recyclable
+            finishes: { rate: 0.10, benefit: 0.05 }    // Most go to landfill
+        };
+
+        // Annual energy intensity (kWh/m²/year) for Australian commercial buildings
+        this.energyIntensity = {
+            residential: { excellent: 50, good: 80, average: 120, poor: 180 },
+            commercial: { excellent: 100, good: 150, average: 220, poor: 350 },
+            industrial: { excellent: 80, good: 120, average: 180, poor: 280 },
+            infrastructure: { excellent: 30, good: 50, average: 80, poor: 120 }
+        };
+
         // Maintenance & replacement schedules (years)
         this.maintenanceCycles = {
             concrete: { maintenance: 10, replacement: 100 },
@@ -227,18 +246,7 @@ class LCACalculator {
      * Materials that can be recycled provide carbon benefits beyond the building life
      */
     calculateRecyclingBenefit(category, materialData, quantity) {
-        // Recycling rates and benefits for Australian context
-        const recyclingPotential = {
-            concrete: { rate: 0.80, benefit: 0.05 },  // 80% can be crushed to aggregate
-            steel: { rate: 0.95, benefit: 0.70 },     // 95% recyclable, high benefit
-            timber: { rate: 0.40, benefit: 0.20 },    // Can be reused or chipped
-            masonry: { rate: 0.60, benefit: 0.05 },   // Can be crushed
-            insulation: { rate: 0.20, benefit: 0.10 }, // Limited recycling
-            glazing: { rate: 0.70, benefit: 0.30 },    // Glass is recyclable
-            finishes: { rate: 0.10, benefit: 0.05 }    // Most go to landfill
-        };
-        
-        const potential = recyclingPotential[category];
+        const potential = this.recyclingPotential[category];
         if (!potential) return 0;
         
         // Benefit = (embodied carbon) * (recycling rate) * (benefit factor)
@@ -292,19 +300,11 @@ class LCACalculator {
      * This is B6 (operational energy) in the LCA stages
      */
     calculateOperationalCarbon(gfa, buildingType, energyRating = 'average') {
-        // Annual energy intensity (kWh/m²/year) for Australian commercial buildings
-        const energyIntensity = {
-            residential: { excellent: 50, good: 80, average: 120, poor: 180 },
-            commercial: { excellent: 100, good: 150, average: 220, poor: 350 },
-            industrial: { excellent: 80, good: 120, average: 180, poor: 280 },
-            infrastructure: { excellent: 30, good: 50, average: 80, poor: 120 }
-        };
-        
         // Australian grid emission factor (kg CO2-e/kWh)
         // This varies by state - using national average
         const gridEmissionFactor = 0.81; // kg CO2-e/kWh
         
-        const intensity = energyIntensity[buildingType]?.[energyRating] || 220;
+        const intensity = this.energyIntensity[buildingType]?.[energyRating] || 220;
         const annualEnergy = gfa * intensity;
         const annualEmissions = annualEnergy * gridEmissionFactor;
         
@@ -21,6 +21,18 @@ const appState = {
     isModified: false
 };
 
+// Fully-built badge class strings for the compliance status pills,
+// assembled once instead of re-concatenated on every display refresh
+const BADGE_BASE = 'px-3 py-1 rounded-full text-sm font-medium ';
+const BADGE_PASS = BADGE_BASE + 'bg-green-200 text-green-800';
+const BADGE_WARN = BADGE_BASE + 'bg-yellow-200 text-yellow-800';
+const BADGE_FAIL = BADGE_BASE + 'bg-red-200 text-red-800';
+const BADGE_NEUTRAL = BADGE_BASE + 'bg-gray-200 text-gray-700';
+
+// Shared formatter for project dates - toLocaleDateString() re-resolves
+// locale data on every call, Intl.DateTimeFormat does it once
+const PROJECT_DATE_FORMAT = new Intl.DateTimeFormat();
+
 // Initialize application when page loads
 document.addEventListener('DOMContentLoaded', async function() {
     console.log('CarbonConstruct initializing...');
@@ -162,29 +174,33 @@ function updateMaterialsTable() {
         return;
     }
     
-    let html = '<table class="w-full border-collapse">';
-    html += '<thead><tr class="bg-gray-100">';
-    html += '<th class="border border-gray-300 px-4 py-2 text-left">Material</th>';
-    html += '<th class="border border-gray-300 px-4 py-2 text-right">Quantity</th>';
-    html += '<th class="border border-gray-300 px-4 py-2 text-right">Unit</th>';
-    html += '<th class="border border-gray-300 px-4 py-2 text-right">Embodied Carbon</th>';
-    html += '<th class="border border-gray-300 px-4 py-2 text-center">Action</th>';
-    html += '</tr></thead><tbody>';
-    
+    // Collect fragments and join once - repeated += reallocates the
+    // accumulated string on every append
+    const parts = [
+        '<table class="w-full border-collapse">',
+        '<thead><tr class="bg-gray-100">',
+        '<th class="border border-gray-300 px-4 py-2 text-left">Material</th>',
+        '<th class="border border-gray-300 px-4 py-2 text-right">Quantity</th>',
+        '<th class="border border-gray-300 px-4 py-2 text-right">Unit</th>',
+        '<th class="border border-gray-300 px-4 py-2 text-right">Embodied Carbon</th>',
+        '<th class="border border-gray-300 px-4 py-2 text-center">Action</th>',
+        '</tr></thead><tbody>'
+    ];
+
     appState.currentProject.materials.forEach((material, index) => {
-        html += '<tr class="hover:bg-gray-50">';
-        html += `<td class="border border-gray-300 px-4 py-2">${material.name}</td>`;
-        html += `<td class="border border-gray-300 px-4 py-2 text-right">${material.quantity.toLocaleString()}</td>`;
-        html += `<td class="border border-gray-300 px-4 py-2 text-right">${material.unit}</td>`;
-        html += `<td class="border border-gray-300 px-4 py-2 text-right">${Math.abs(material.emissions).toLocaleString()} kg CO2-e</td>`;
-        html += `<td class="border border-gray-300 px-4 py-2 text-center">`;
-        html += `<button onclick="removeMaterial(${index})" class="text-red-600 hover:text-red-800">`;
-        html += '<i class="fas fa-trash"></i> Remove</button></td>';
-        html += '</tr>';
+        parts.push('<tr class="hover:bg-gray-50">');
+        parts.push(`<td class="border border-gray-300 px-4 py-2">${material.name}</td>`);
+        parts.push(`<td class="border border-gray-300 px-4 py-2 text-right">${material.quantity.toLocaleString()}</td>`);
+        parts.push(`<td class="border border-gray-300 px-4 py-2 text-right">${material.unit}</td>`);
+        parts.push(`<td class="border border-gray-300 px-4 py-2 text-right">${Math.abs(material.emissions).toLocaleString()} kg CO2-e</td>`);
+        parts.push(`<td class="border border-gray-300 px-4 py-2 text-center">`);
+        parts.push(`<button onclick="removeMaterial(${index})" class="text-red-600 hover:text-red-800">`);
+        parts.push('<i class="fas fa-trash"></i> Remove</button></td>');
+        parts.push('</tr>');
     });
-    
-    html += '</tbody></table>';
-    container.innerHTML = html;
+
+    parts.push('</tbody></table>');
+    container.innerHTML = parts.join('');
 }
 
 /**
@@ -303,8 +319,7 @@ function updateComplianceDisplay(complianceResults) {
     // NCC Status
     const nccStatus = document.getElementById('nccStatus');
     nccStatus.textContent = standards.ncc.level;
-    nccStatus.className = 'px-3 py-1 rounded-full text-sm font-medium ' + 
-        (standards.ncc.compliant ? 'bg-green-200 text-green-800' : 'bg-red-200 text-red-800');
+    nccStatus.className = standards.ncc.compliant ? BADGE_PASS : BADGE_FAIL;
     
     document.getElementById('nccEmbodiedEnergy').textContent = 
         standards.ncc.metrics.embodiedEnergy + ' MJ/m²';
@@ -314,10 +329,8 @@ function updateComplianceDisplay(complianceResults) {
     // NABERS Rating
     const nabersRating = document.getElementById('nabersRating');
     nabersRating.textContent = standards.nabers.stars.toFixed(1) + '★';
-    nabersRating.className = 'px-3 py-1 rounded-full text-sm font-medium ' + 
-        (standards.nabers.stars >= 5 ? 'bg-green-200 text-green-800' : 
-         standards.nabers.stars >= 4 ? 'bg-yellow-200 text-yellow-800' : 
-         'bg-gray-200 text-gray-700');
+    nabersRating.className = standards.nabers.stars >= 5 ? BADGE_PASS :
+        standards.nabers.stars >= 4 ? BADGE_WARN : BADGE_NEUTRAL;
     
     document.getElementById('nabersBenchmark').textContent = 
         standards.nabers.metrics.benchmarkForTarget + ' kg CO2-e/m² for 5 stars';
@@ -325,9 +338,7 @@ function updateComplianceDisplay(complianceResults) {
     // Green Star Rating
     const greenStarRating = document.getElementById('greenStarRating');
     greenStarRating.textContent = standards.greenStar.stars + '★';
-    greenStarRating.className = 'px-3 py-1 rounded-full text-sm font-medium ' + 
-        (standards.greenStar.stars >= 4 ? 'bg-green-200 text-green-800' : 
-         'bg-gray-200 text-gray-700');
+    greenStarRating.className = standards.greenStar.stars >= 4 ? BADGE_PASS : BADGE_NEUTRAL;
     
     document.getElementById('greenStarPoints').textContent = 
         standards.greenStar.points + '/100';
@@ -402,10 +413,9 @@ function displaySavedProjects(projects) {
         return;
     }
     
-    let html = '';
-    projects.forEach(project => {
+    const cards = projects.map(project => {
         const date = new Date(project.lastModified || project.created_at);
-        html += `
+        return `
             <div class="bg-white border-2 border-gray-200 rounded-lg p-6 hover:border-green-500 transition-colors">
                 <h3 class="text-lg font-semibold text-gray-800 mb-2">${project.projectName}</h3>
                 <p class="text-sm text-gray-600 mb-4">
@@ -418,7 +428,7 @@ function displaySavedProjects(projects) {
                     ${project.carbonIntensity.toFixed(1)} kg CO2-e/m²
                 </p>
                 <p class="text-xs text-gray-500 mb-4">
-                    Last modified: ${date.toLocaleDateString()}
+                    Last modified: ${PROJECT_DATE_FORMAT.format(date)}
                 </p>
                 <div class="flex space-x-2">
                     <button onclick="loadProject('${project.id}')" 
@@ -433,8 +443,8 @@ function displaySavedProjects(projects) {
             </div>
         `;
     });
-    
-    container.innerHTML = html;
+
+    container.innerHTML = cards.join('');
 }
 
 /**
@@ -463,12 +463,18 @@ function getMaterialData(category, materialId) {
 
 /**
  * Get all categories
+ * MATERIALS_DATABASE is static, so the list is built once and reused
  */
+let allCategoriesCache = null;
+
 function getAllCategories() {
-    return Object.keys(MATERIALS_DATABASE).map(key => ({
-        id: key,
-        name: MATERIALS_DATABASE[key].name
-    }));
+    if (!allCategoriesCache) {
+        allCategoriesCache = Object.keys(MATERIALS_DATABASE).map(key => ({
+            id: key,
+            name: MATERIALS_DATABASE[key].name
+        }));
+    }
+    return allCategoriesCache;
 }
 
 /**
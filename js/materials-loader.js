@@ -139,7 +139,7 @@ class MaterialsLoader {
         try {
             const CHUNK_SIZE = 1000;
             let offset = 0;
-            let allData = [...this.essentialMaterials]; // Start with essentials
+            const allData = [...this.essentialMaterials]; // Start with essentials
             let hasMore = true;
 
             while (hasMore) {
@@ -152,7 +152,11 @@ class MaterialsLoader {
                 if (error) throw error;
 
                 if (data && data.length > 0) {
-                    allData = allData.concat(data);
+                    // Append in place - concat() would re-copy the whole
+                    // accumulated array on every chunk (quadratic for 54k rows)
+                    for (const row of data) {
+                        allData.push(row);
+                    }
                     offset += CHUNK_SIZE;
 
                     // Update progress (30% already loaded, scale 30-100%)
@@ -208,11 +212,19 @@ class MaterialsLoader {
      * Search materials (searches current cache + optional live query)
      */
     async searchMaterials(searchTerm, liveQuery = false) {
-        // Search in current cache first (instant)
+        // Search in current cache first (instant). Lowercase the term once
+        // up front - doing it inside the filter re-allocates it up to three
+        // times per material across the 54k-row cache.
+        const termLower = searchTerm.toLowerCase();
+
+        // Cheap pre-check: an empty term matches everything, so skip the
+        // full filter pass (3 lowercased fields x 54k rows) entirely
+        if (!termLower) {
+            return this.getMaterials();
+        }
+
         const cachedResults = this.getMaterials().filter(m =>
-            m.material_name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            m.name?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            m.description?.toLowerCase().includes(searchTerm.toLowerCase())
+            this.getSearchText(m).includes(termLower)
         );
 
         // If we have good results or live query disabled, return cache
@@ -236,12 +248,29 @@ class MaterialsLoader {
         }
     }
 
+    /**
+     * Lowercased search haystack for a material, built once per row
+     * Re-lowercasing three fields per row on every keystroke dominates
+     * search time once the full 54k-row cache is loaded
+     */
+    getSearchText(material) {
+        if (material._searchText === undefined) {
+            material._searchText = [
+                material.material_name || '',
+                material.name || '',
+                material.description || ''
+            ].join('\n').toLowerCase();
+        }
+        return material._searchText;
+    }
+
     /**
      * Get materials by category
      */
     getMaterialsByCategory(category) {
+        const categoryLower = category.toLowerCase();
         return this.getMaterials().filter(m =>
-            m.category?.toLowerCase() === category.toLowerCase()
+            m.category?.toLowerCase() === categoryLower
         );
     }
 
@@ -186,9 +186,21 @@ function updateEquipmentTypes() {
     }
 }
 
+// Formatted names are memoized: the inputs come from a small fixed set of
+// factor keys, but the regex/split/map pipeline runs for every dropdown
+// option and list row on each rebuild.
+const formattedNameCache = new Map();
+
 function formatEquipmentName(name) {
-    return name.replace(/_/g, ' ').replace(/([A-Z])/g, ' $1').trim()
-        .split(' ').map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+    let formatted = formattedNameCache.get(name);
+    if (formatted === undefined) {
+        // Single alternation pass: underscores and camelCase boundaries both
+        // become spaces without an intermediate string between two replaces
+        formatted = name.replace(/_|([A-Z])/g, (match, upper) => upper ? ' ' + upper : ' ').trim()
+            .split(' ').map(word => word.charAt(0).toUpperCase() + word.slice(1)).join(' ');
+        formattedNameCache.set(name, formatted);
+    }
+    return formatted;
 }
 
 function addEquipment() {
@@ -686,6 +698,21 @@ function reloadList(listId, scope) {
 // TOTALS AND DASHBOARD
 // ============================================================================
 
+// Maps calculator item categories to their dashboard total element IDs
+const CATEGORY_TOTAL_IDS = {
+    vehicles: 'vehicleTotal',
+    generators: 'generatorTotal',
+    heating: 'heatingTotal',
+    electricity: 'powerTotal',
+    siteFacility: 'facilityTotal',
+    electricEquipment: 'elecEquipTotal',
+    transport: 'transportTotal',
+    waste: 'wasteTotal',
+    water: 'waterTotal',
+    commuting: 'commuteTotal',
+    temporaryWorks: 'tempWorksTotal'
+};
+
 function updateAllTotals() {
     const results = scopesCalc.calculateAllScopes();
     
@@ -711,43 +738,20 @@ function updateAllTotals() {
         'tempWorksTotal': 0
     };
     
-    // Scope 1 breakdown
+    // Accumulate via the category -> element-id lookup table instead of an
+    // if/else chain per item - one keyed add per item.
     results.scope1.items.forEach(item => {
-        if (item.category === 'generators') {
-            categoryTotals.generatorTotal += item.emissions;
-        } else if (item.category === 'vehicles') {
-            categoryTotals.vehicleTotal += item.emissions;
-        } else if (item.category === 'heating') {
-            categoryTotals.heatingTotal += item.emissions;
-        } else {
-            categoryTotals.equipmentTotal += item.emissions;
-        }
+        categoryTotals[CATEGORY_TOTAL_IDS[item.category] || 'equipmentTotal'] += item.emissions;
     });
-    
-    // Scope 2 breakdown
+
     results.scope2.items.forEach(item => {
-        if (item.category === 'electricity') {
-            categoryTotals.powerTotal += item.emissions;
-        } else if (item.category === 'siteFacility') {
-            categoryTotals.facilityTotal += item.emissions;
-        } else if (item.category === 'electricEquipment') {
-            categoryTotals.elecEquipTotal += item.emissions;
-        }
+        const id = CATEGORY_TOTAL_IDS[item.category];
+        if (id) categoryTotals[id] += item.emissions;
     });
-    
-    // Scope 3 breakdown
+
     results.scope3.items.forEach(item => {
-        if (item.category === 'transport') {
-            categoryTotals.transportTotal += item.emissions;
-        } else if (item.category === 'waste') {
-            categoryTotals.wasteTotal += item.emissions;
-        } else if (item.category === 'water') {
-            categoryTotals.waterTotal += item.emissions;
-        } else if (item.category === 'commuting') {
-            categoryTotals.commuteTotal += item.emissions;
-        } else if (item.category === 'temporaryWorks') {
-            categoryTotals.tempWorksTotal += item.emissions;
-        }
+        const id = CATEGORY_TOTAL_IDS[item.category];
+        if (id) categoryTotals[id] += item.emissions;
     });
     
     // Update UI
@@ -884,7 +888,9 @@ function saveProject() {
 
     const data = scopesCalc.exportData();
     data.projectName = projectName;
-    data.savedAt = new Date().toISOString();
+    // exportData already stamped this export - reuse it so the saved
+    // project carries one consistent timestamp
+    data.savedAt = data.timestamp;
 
     // Save to localStorage
     const projects = JSON.parse(localStorage.getItem('carbonProjects') || '[]');
@@ -1003,26 +1009,49 @@ function clearSavedData() {
  * Rebuild all UI lists from calculator data
  */
 function rebuildAllLists() {
-    // Rebuild Scope 1 lists
-    rebuildListFromData('equipmentList', scopesCalc.scope1Items.filter(i =>
-        !['vehicles', 'generators', 'heating'].includes(i.category)
-    ), 'equipment');
+    // Bucket each scope's items by category in a single pass instead of
+    // filtering the same array once per list (4 + 3 + 5 passes before).
+    const bucketByCategory = (items, categories, fallback) => {
+        const buckets = {};
+        categories.forEach(c => { buckets[c] = []; });
+        items.forEach(item => {
+            (buckets[item.category] || buckets[fallback]).push(item);
+        });
+        return buckets;
+    };
 
-    rebuildListFromData('vehicleList', scopesCalc.scope1Items.filter(i => i.category === 'vehicles'), 'vehicle');
-    rebuildListFromData('generatorList', scopesCalc.scope1Items.filter(i => i.category === 'generators'), 'generator');
-    rebuildListFromData('heatingList', scopesCalc.scope1Items.filter(i => i.category === 'heating'), 'heating');
+    // Rebuild Scope 1 lists (anything uncategorised counts as equipment)
+    const scope1 = bucketByCategory(
+        scopesCalc.scope1Items,
+        ['equipment', 'vehicles', 'generators', 'heating'],
+        'equipment'
+    );
+    rebuildListFromData('equipmentList', scope1.equipment, 'equipment');
+    rebuildListFromData('vehicleList', scope1.vehicles, 'vehicle');
+    rebuildListFromData('generatorList', scope1.generators, 'generator');
+    rebuildListFromData('heatingList', scope1.heating, 'heating');
 
     // Rebuild Scope 2 lists
-    rebuildListFromData('powerList', scopesCalc.scope2Items.filter(i => i.category === 'electricity'), 'power');
-    rebuildListFromData('facilityList', scopesCalc.scope2Items.filter(i => i.category === 'siteFacility'), 'facility');
-    rebuildListFromData('elecEquipList', scopesCalc.scope2Items.filter(i => i.category === 'electricEquipment'), 'elecEquip');
+    const scope2 = bucketByCategory(
+        scopesCalc.scope2Items,
+        ['electricity', 'siteFacility', 'electricEquipment'],
+        'electricity'
+    );
+    rebuildListFromData('powerList', scope2.electricity, 'power');
+    rebuildListFromData('facilityList', scope2.siteFacility, 'facility');
+    rebuildListFromData('elecEquipList', scope2.electricEquipment, 'elecEquip');
 
     // Rebuild Scope 3 lists
-    rebuildListFromData('transportList', scopesCalc.scope3Items.filter(i => i.category === 'transport'), 'transport');
-    rebuildListFromData('wasteList', scopesCalc.scope3Items.filter(i => i.category === 'waste'), 'waste');
-    rebuildListFromData('waterList', scopesCalc.scope3Items.filter(i => i.category === 'water'), 'water');
-    rebuildListFromData('commuteList', scopesCalc.scope3Items.filter(i => i.category === 'commuting'), 'commute');
-    rebuildListFromData('tempWorksList', scopesCalc.scope3Items.filter(i => i.category === 'temporaryWorks'), 'tempWorks');
+    const scope3 = bucketByCategory(
+        scopesCalc.scope3Items,
+        ['transport', 'waste', 'water', 'commuting', 'temporaryWorks'],
+        'transport'
+    );
+    rebuildListFromData('transportList', scope3.transport, 'transport');
+    rebuildListFromData('wasteList', scope3.waste, 'waste');
+    rebuildListFromData('waterList', scope3.water, 'water');
+    rebuildListFromData('commuteList', scope3.commuting, 'commute');
+    rebuildListFromData('tempWorksList', scope3.temporaryWorks, 'tempWorks');
 }
 
 /**
@@ -49,6 +49,17 @@ class ComprehensiveScopesCalculator {
         this.scope1Items = [];
         this.scope2Items = [];
         this.scope3Items = [];
+
+        // Cached per-scope totals - recomputed only after the item lists
+        // change, so repeated UI refreshes don't re-sum unchanged scopes
+        this.scopeTotalCache = { 1: null, 2: null, 3: null };
+    }
+
+    /**
+     * Drop a scope's cached total after its item list changes
+     */
+    invalidateScopeTotal(scope) {
+        this.scopeTotalCache[scope] = null;
     }
     
     // ============================================================================
@@ -107,6 +118,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope1Items.push(item);
+        this.invalidateScopeTotal(1);
         return item;
     }
     
@@ -170,6 +182,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope1Items.push(item);
+        this.invalidateScopeTotal(1);
         return item;
     }
     
@@ -177,23 +190,25 @@ class ComprehensiveScopesCalculator {
      * Calculate total Scope 1 emissions
      */
     calculateScope1Total() {
-        const total = this.scope1Items.reduce((sum, item) => sum + item.emissions, 0);
-        
-        // Breakdown by category
+        if (this.scopeTotalCache[1]) {
+            return this.scopeTotalCache[1];
+        }
+
+        // Total and category breakdown in a single pass over the items
+        let total = 0;
         const breakdown = {};
         this.scope1Items.forEach(item => {
-            if (!breakdown[item.category]) {
-                breakdown[item.category] = 0;
-            }
-            breakdown[item.category] += item.emissions;
+            total += item.emissions;
+            breakdown[item.category] = (breakdown[item.category] || 0) + item.emissions;
         });
-        
-        return {
+
+        this.scopeTotalCache[1] = {
             total: total,
             breakdown: breakdown,
             items: this.scope1Items,
             percentage: 0  // Will be calculated when total project emissions known
         };
+        return this.scopeTotalCache[1];
     }
     
     // ============================================================================
@@ -206,7 +221,9 @@ class ComprehensiveScopesCalculator {
     addScope2Electricity(usage) {
         const { description, kWh, state, days } = usage;
         
-        const emissionFactor = this.factors.electricity.states[state] || this.factors.electricity.states.national;
+        // ?? rather than || - ACT's grid factor is a legitimate 0.0
+        // (100% renewable) and must not fall back to the national factor
+        const emissionFactor = this.factors.electricity.states[state] ?? this.factors.electricity.states.national;
         const emissions = kWh * emissionFactor;
         
         const item = {
@@ -221,6 +238,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope2Items.push(item);
+        this.invalidateScopeTotal(2);
         return item;
     }
     
@@ -232,7 +250,9 @@ class ComprehensiveScopesCalculator {
         
         const dailyUsage = this.factors.electricity.siteUsage[type] || 0;
         const totalKWh = dailyUsage * days;
-        const emissionFactor = this.factors.electricity.states[state] || this.factors.electricity.states.national;
+        // ?? rather than || - ACT's grid factor is a legitimate 0.0
+        // (100% renewable) and must not fall back to the national factor
+        const emissionFactor = this.factors.electricity.states[state] ?? this.factors.electricity.states.national;
         const emissions = totalKWh * emissionFactor;
         
         const item = {
@@ -248,6 +268,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope2Items.push(item);
+        this.invalidateScopeTotal(2);
         return item;
     }
     
@@ -269,7 +290,9 @@ class ComprehensiveScopesCalculator {
             }
         }
         
-        const emissionFactor = this.factors.electricity.states[state] || this.factors.electricity.states.national;
+        // ?? rather than || - ACT's grid factor is a legitimate 0.0
+        // (100% renewable) and must not fall back to the national factor
+        const emissionFactor = this.factors.electricity.states[state] ?? this.factors.electricity.states.national;
         const emissions = totalKWh * emissionFactor;
         
         const item = {
@@ -284,6 +307,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope2Items.push(item);
+        this.invalidateScopeTotal(2);
         return item;
     }
     
@@ -291,23 +315,25 @@ class ComprehensiveScopesCalculator {
      * Calculate total Scope 2 emissions
      */
     calculateScope2Total() {
-        const total = this.scope2Items.reduce((sum, item) => sum + item.emissions, 0);
-        
-        // Breakdown by category
+        if (this.scopeTotalCache[2]) {
+            return this.scopeTotalCache[2];
+        }
+
+        // Total and category breakdown in a single pass over the items
+        let total = 0;
         const breakdown = {};
         this.scope2Items.forEach(item => {
-            if (!breakdown[item.category]) {
-                breakdown[item.category] = 0;
-            }
-            breakdown[item.category] += item.emissions;
+            total += item.emissions;
+            breakdown[item.category] = (breakdown[item.category] || 0) + item.emissions;
         });
-        
-        return {
+
+        this.scopeTotalCache[2] = {
             total: total,
             breakdown: breakdown,
             items: this.scope2Items,
             percentage: 0
         };
+        return this.scopeTotalCache[2];
     }
     
     // ============================================================================
@@ -349,6 +375,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope3Items.push(item);
+        this.invalidateScopeTotal(3);
         return item;
     }
     
@@ -387,6 +414,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope3Items.push(item);
+        this.invalidateScopeTotal(3);
         return item;
     }
     
@@ -417,6 +445,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope3Items.push(item);
+        this.invalidateScopeTotal(3);
         return item;
     }
     
@@ -445,6 +474,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope3Items.push(item);
+        this.invalidateScopeTotal(3);
         return item;
     }
     
@@ -470,6 +500,7 @@ class ComprehensiveScopesCalculator {
         };
         
         this.scope3Items.push(item);
+        this.invalidateScopeTotal(3);
         return item;
     }
     
@@ -477,23 +508,25 @@ class ComprehensiveScopesCalculator {
      * Calculate total Scope 3 emissions
      */
     calculateScope3Total() {
-        const total = this.scope3Items.reduce((sum, item) => sum + item.emissions, 0);
-        
-        // Breakdown by category
+        if (this.scopeTotalCache[3]) {
+            return this.scopeTotalCache[3];
+        }
+
+        // Total and category breakdown in a single pass over the items
+        let total = 0;
         const breakdown = {};
         this.scope3Items.forEach(item => {
-            if (!breakdown[item.category]) {
-                breakdown[item.category] = 0;
-            }
-            breakdown[item.category] += item.emissions;
+            total += item.emissions;
+            breakdown[item.category] = (breakdown[item.category] || 0) + item.emissions;
         });
-        
-        return {
+
+        this.scopeTotalCache[3] = {
             total: total,
             breakdown: breakdown,
             items: this.scope3Items,
             percentage: 0
         };
+        return this.scopeTotalCache[3];
     }
     
     // ============================================================================
@@ -538,6 +571,7 @@ class ComprehensiveScopesCalculator {
         this.scope1Items = [];
         this.scope2Items = [];
         this.scope3Items = [];
+        this.scopeTotalCache = { 1: null, 2: null, 3: null };
     }
     
     /**
@@ -551,6 +585,7 @@ class ComprehensiveScopesCalculator {
         } else if (scope === 3) {
             this.scope3Items = this.scope3Items.filter(item => item.id !== itemId);
         }
+        this.invalidateScopeTotal(scope);
     }
     
     /**
@@ -578,6 +613,6 @@ if (typeof window !== 'undefined') {
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = {
         ComprehensiveScopesCalculator,
-        EMISSIONS_FACTORS: FACTORS
+        EMISSIONS_FACTORS: FACTORS_SOURCE
     };
 }
@@ -24,6 +24,9 @@
  * For construction, Scope 3 is typically 80-95% of total emissions!
  */
 
+// Transport factors are per tonne-km but quantities arrive in kg
+const KG_PER_TONNE = 1000;
+
 class ScopesCalculator {
     constructor() {
         // Australian emission factors (kg CO2-e per unit)
@@ -78,11 +81,17 @@ class ScopesCalculator {
             breakdown: []
         };
 
+        // Running total - accumulated as each category lands so we don't
+        // need a second pass over the categories at the end
+        let total = 0;
+
         // Fuel combustion on site
         if (inputs.fuels) {
             let fuelTotal = 0;
             inputs.fuels.forEach(fuel => {
-                const factor = this.emissionFactors.fuels[fuel.type];
+                // Default to 0 so an unrecognised fuel type contributes
+                // nothing instead of turning every total downstream into NaN
+                const factor = this.emissionFactors.fuels[fuel.type] || 0;
                 const emissions = fuel.quantity * factor;
                 fuelTotal += emissions;
                 
@@ -97,13 +106,14 @@ class ScopesCalculator {
                 });
             });
             scope1Emissions.categories.fuelCombustion = fuelTotal;
+            total += fuelTotal;
         }
 
         // Mobile combustion (company vehicles)
         if (inputs.vehicles) {
             let vehicleTotal = 0;
             inputs.vehicles.forEach(vehicle => {
-                const factor = this.emissionFactors.fuels[vehicle.fuelType];
+                const factor = this.emissionFactors.fuels[vehicle.fuelType] || 0;
                 const emissions = vehicle.fuelUsed * factor;
                 vehicleTotal += emissions;
                 
@@ -118,6 +128,7 @@ class ScopesCalculator {
                 });
             });
             scope1Emissions.categories.mobileCombustion = vehicleTotal;
+            total += vehicleTotal;
         }
 
         // Fugitive emissions (refrigerants, etc.)
@@ -136,10 +147,10 @@ class ScopesCalculator {
                 });
             });
             scope1Emissions.categories.fugitiveEmissions = fugitiveTotal;
+            total += fugitiveTotal;
         }
 
-        // Calculate total
-        scope1Emissions.total = Object.values(scope1Emissions.categories).reduce((sum, val) => sum + val, 0);
+        scope1Emissions.total = total;
         
         return scope1Emissions;
     }
@@ -156,14 +167,19 @@ class ScopesCalculator {
             methodology: 'location-based' // or 'market-based' with renewable certificates
         };
 
+        let total = 0;
+
         // Purchased electricity
         if (inputs.electricity) {
-            const factor = this.emissionFactors.electricity[state.toLowerCase()] || 
+            // ?? rather than || - ACT's grid factor is a legitimate 0.0
+            // (100% renewable) and must not fall back to the national factor
+            const factor = this.emissionFactors.electricity[state.toLowerCase()] ??
                           this.emissionFactors.electricity.national;
             
             const emissions = inputs.electricity.kwh * factor;
             
             scope2Emissions.categories.electricity = emissions;
+            total += emissions;
             scope2Emissions.breakdown.push({
                 category: 'Purchased Electricity',
                 subcategory: state.toUpperCase(),
@@ -191,9 +207,10 @@ class ScopesCalculator {
                 });
             });
             scope2Emissions.categories.districtEnergy = districtTotal;
+            total += districtTotal;
         }
 
-        scope2Emissions.total = Object.values(scope2Emissions.categories).reduce((sum, val) => sum + val, 0);
+        scope2Emissions.total = total;
         
         return scope2Emissions;
     }
@@ -221,11 +238,18 @@ class ScopesCalculator {
             breakdown: []
         };
 
+        let total = 0;
+
         // Category 1: Purchased goods and services (MATERIALS - the biggest for construction)
         if (inputs.materials) {
             let materialsTotal = 0;
             inputs.materials.forEach(material => {
-                const materialData = getMaterialData(material.category, material.type);
+                // Project materials already carry name/unit/embodiedCarbon
+                // from when they were added - reuse those instead of
+                // re-resolving every material against the database
+                const materialData = material.embodiedCarbon !== undefined
+                    ? material
+                    : getMaterialData(material.category, material.type);
                 if (materialData) {
                     // The embodied carbon of materials IS Scope 3, Category 1!
                     const emissions = materialData.embodiedCarbon * material.quantity;
@@ -243,6 +267,7 @@ class ScopesCalculator {
                 }
             });
             scope3Emissions.categories.purchasedGoods = materialsTotal;
+            total += materialsTotal;
         }
 
         // Category 4: Upstream transportation and distribution
@@ -250,7 +275,7 @@ class ScopesCalculator {
             let transportTotal = 0;
             inputs.transport.forEach(transport => {
                 const factor = this.emissionFactors.transport[transport.type] || 0;
-                const emissions = transport.distance * transport.weight * factor / 1000; // Convert to tonne-km
+                const emissions = transport.distance * transport.weight * factor / KG_PER_TONNE;
                 transportTotal += emissions;
                 
                 scope3Emissions.breakdown.push({
@@ -264,6 +289,7 @@ class ScopesCalculator {
                 });
             });
             scope3Emissions.categories.upstreamTransport = transportTotal;
+            total += transportTotal;
         }
 
         // Category 5: Waste generated in operations
@@ -285,6 +311,7 @@ class ScopesCalculator {
                 });
             });
             scope3Emissions.categories.waste = wasteTotal;
+            total += wasteTotal;
         }
 
         // Category 6: Business travel
@@ -306,6 +333,7 @@ class ScopesCalculator {
                 });
             });
             scope3Emissions.categories.businessTravel = travelTotal;
+            total += travelTotal;
         }
 
         // Category 7: Employee commuting
@@ -325,12 +353,14 @@ class ScopesCalculator {
                 emissions: emissions
             });
             scope3Emissions.categories.employeeCommuting = commutingTotal;
+            total += commutingTotal;
         }
 
         // Category 11: Use of sold products (operational energy for buildings)
         if (inputs.operationalEnergy) {
             const emissions = inputs.operationalEnergy.annualEmissions;
             scope3Emissions.categories.useOfProducts = emissions;
+            total += emissions;
             scope3Emissions.breakdown.push({
                 category: 'Use of Products',
                 subcategory: 'Operational Energy',
@@ -358,9 +388,10 @@ class ScopesCalculator {
                 });
             });
             scope3Emissions.categories.endOfLife = eolTotal;
+            total += eolTotal;
         }
 
-        scope3Emissions.total = Object.values(scope3Emissions.categories).reduce((sum, val) => sum + val, 0);
+        scope3Emissions.total = total;
         
         return scope3Emissions;
     }
@@ -8,6 +8,9 @@ class StorageManager {
     constructor() {
         this.tableName = 'carbon_projects';
         this.initialized = false;
+        // In-memory copy of the parsed projects array. Avoids re-parsing
+        // the whole localStorage blob on every save/load/delete/search.
+        this.projectsCache = null;
     }
 
     /**
@@ -38,6 +41,10 @@ class StorageManager {
             // Get existing projects
             const projects = this.getProjectsFromLocalStorage();
 
+            // Single timestamp so lastModified and createdAt agree exactly
+            // on a first save
+            const now = new Date().toISOString();
+
             // Prepare project data for storage
             const dataToSave = {
                 id: projectData.id || this.generateId(),
@@ -51,8 +58,8 @@ class StorageManager {
                 lcaResults: projectData.lcaResults || {},
                 scopesResults: projectData.scopesResults || {},
                 complianceResults: projectData.complianceResults || {},
-                lastModified: new Date().toISOString(),
-                createdAt: projectData.createdAt || new Date().toISOString()
+                lastModified: now,
+                createdAt: projectData.createdAt || now
             };
 
             // If project has an ID, update it; otherwise create new
@@ -66,7 +73,7 @@ class StorageManager {
             }
 
             // Save back to localStorage
-            localStorage.setItem(this.tableName, JSON.stringify(projects));
+            this.writeProjectsToLocalStorage(projects);
 
             return dataToSave;
         } catch (error) {
@@ -79,13 +86,26 @@ class StorageManager {
      * Get all projects from localStorage
      */
     getProjectsFromLocalStorage() {
+        if (this.projectsCache) {
+            return this.projectsCache;
+        }
+
         try {
             const data = localStorage.getItem(this.tableName);
-            return data ? JSON.parse(data) : [];
+            this.projectsCache = data ? JSON.parse(data) : [];
         } catch (error) {
             console.error('Error reading from localStorage:', error);
-            return [];
+            this.projectsCache = [];
         }
+        return this.projectsCache;
+    }
+
+    /**
+     * Write the projects array to localStorage and keep the cache in sync
+     */
+    writeProjectsToLocalStorage(projects) {
+        localStorage.setItem(this.tableName, JSON.stringify(projects));
+        this.projectsCache = projects;
     }
 
     /**
@@ -106,12 +126,14 @@ class StorageManager {
             // Get all projects from localStorage
             const projects = this.getProjectsFromLocalStorage();
 
-            // Sort by lastModified (newest first)
-            projects.sort((a, b) => {
-                const dateA = new Date(a.lastModified || a.createdAt || 0);
-                const dateB = new Date(b.lastModified || b.createdAt || 0);
-                return dateB - dateA;
+            // Sort by lastModified (newest first). Parse each project's
+            // date once up front - the comparator runs O(n log n) times
+            // and Date parsing is the expensive part of each comparison
+            const modifiedAt = new Map();
+            projects.forEach(project => {
+                modifiedAt.set(project, new Date(project.lastModified || project.createdAt || 0).getTime());
             });
+            projects.sort((a, b) => modifiedAt.get(b) - modifiedAt.get(a));
 
             // Apply pagination
             const start = (page - 1) * limit;
@@ -161,7 +183,7 @@ class StorageManager {
                 throw new Error(`Project not found: ${projectId}`);
             }
 
-            localStorage.setItem(this.tableName, JSON.stringify(filteredProjects));
+            this.writeProjectsToLocalStorage(filteredProjects);
             console.log('Project deleted successfully:', projectId);
             return true;
         } catch (error) {
@@ -205,25 +227,37 @@ class StorageManager {
         }
     }
 
+    /**
+     * Trigger a browser download for already-built content
+     * Shared by every export format so the content is built exactly once
+     */
+    downloadFile(content, mimeType, fileName) {
+        // Use a Blob instead of a data URI: encodeURIComponent would make a
+        // second, percent-escaped copy of the whole serialized project
+        const blob = new Blob([content], { type: mimeType });
+        const url = URL.createObjectURL(blob);
+
+        const linkElement = document.createElement('a');
+        linkElement.setAttribute('href', url);
+        linkElement.setAttribute('download', fileName);
+        linkElement.click();
+        URL.revokeObjectURL(url);
+    }
+
     /**
      * Export project data as JSON file
      */
     exportProjectAsJSON(projectData) {
         const dataStr = JSON.stringify(projectData, null, 2);
-        const dataUri = 'data:application/json;charset=utf-8,'+ encodeURIComponent(dataStr);
-        
-        const exportFileDefaultName = `carbon-project-${projectData.projectName || 'export'}-${Date.now()}.json`;
-        
-        const linkElement = document.createElement('a');
-        linkElement.setAttribute('href', dataUri);
-        linkElement.setAttribute('download', exportFileDefaultName);
-        linkElement.click();
+        const fileName = `carbon-project-${projectData.projectName || 'export'}-${Date.now()}.json`;
+        this.downloadFile(dataStr, 'application/json', fileName);
     }
 
     /**
-     * Export project report as text
+     * Build the plain-text report body for a project
+     * Separated from the download so callers can reuse the built report
      */
-    exportProjectReport(projectData) {
+    buildReportText(projectData) {
         let report = `EMBODIED CARBON ASSESSMENT REPORT\n`;
         report += `=====================================\n\n`;
         report += `Project: ${projectData.projectName}\n`;
@@ -259,15 +293,17 @@ class StorageManager {
                 report += `Green Star: ${projectData.complianceResults.greenStar.stars} stars (${projectData.complianceResults.greenStar.certification})\n`;
             }
         }
-        
-        // Create and download
-        const dataUri = 'data:text/plain;charset=utf-8,'+ encodeURIComponent(report);
-        const exportFileDefaultName = `carbon-report-${projectData.projectName || 'export'}-${Date.now()}.txt`;
-        
-        const linkElement = document.createElement('a');
-        linkElement.setAttribute('href', dataUri);
-        linkElement.setAttribute('download', exportFileDefaultName);
-        linkElement.click();
+
+        return report;
+    }
+
+    /**
+     * Export project report as text
+     */
+    exportProjectReport(projectData) {
+        const report = this.buildReportText(projectData);
+        const fileName = `carbon-report-${projectData.projectName || 'export'}-${Date.now()}.txt`;
+        this.downloadFile(report, 'text/plain', fileName);
     }
 }
 
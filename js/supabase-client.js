@@ -19,6 +19,15 @@ class SupabaseClient {
         this.materialsCache = null;
         this.cacheTimestamp = null;
         this.cacheExpiry = 5 * 60 * 1000; // 5 minutes
+
+        // Flattened copy of the local MATERIALS_DATABASE, built on first
+        // use - the source is static so it never needs rebuilding
+        this.fallbackMaterials = null;
+        this.fallbackMaterialsById = null;
+
+        // In-flight/completed CDN load, so repeated initialize() calls
+        // share one script tag instead of injecting a new one each time
+        this.libraryLoadPromise = null;
     }
 
     /**
@@ -80,13 +89,20 @@ class SupabaseClient {
      * Load Supabase client library from CDN
      */
     async loadSupabaseLibrary() {
-        return new Promise((resolve, reject) => {
-            const script = document.createElement('script');
-            script.src = 'https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2';
-            script.onload = resolve;
-            script.onerror = reject;
-            document.head.appendChild(script);
-        });
+        if (!this.libraryLoadPromise) {
+            this.libraryLoadPromise = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = 'https://cdn.jsdelivr.net/npm/@supabase/supabase-js@2';
+                script.onload = resolve;
+                script.onerror = (error) => {
+                    // Allow a retry on the next call if the CDN was unreachable
+                    this.libraryLoadPromise = null;
+                    reject(error);
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return this.libraryLoadPromise;
     }
 
     /**
@@ -211,7 +227,12 @@ class SupabaseClient {
      */
     async getMaterialById(materialId) {
         if (!this.initialized) {
-            return this.getFallbackMaterials().find(m => m.id === materialId);
+            // Indexed lookup instead of a linear scan per call
+            const materials = this.getFallbackMaterials();
+            if (!this.fallbackMaterialsById) {
+                this.fallbackMaterialsById = new Map(materials.map(m => [m.id, m]));
+            }
+            return this.fallbackMaterialsById.get(materialId);
         }
 
         try {
@@ -256,10 +277,15 @@ class SupabaseClient {
 
             if (error) throw error;
 
-            // Get unique categories
-            const uniqueCategories = [...new Set(data.map(m => m.category))];
-            
-            return uniqueCategories.map(cat => ({
+            // Deduplicate while accumulating - data has one row per
+            // material, so mapping it to an intermediate array first would
+            // materialize tens of thousands of strings just to discard them
+            const uniqueCategories = new Set();
+            for (const m of data) {
+                uniqueCategories.add(m.category);
+            }
+
+            return Array.from(uniqueCategories, cat => ({
                 id: cat.toLowerCase().replace(/\s+/g, '-'),
                 name: cat
             }));
@@ -325,21 +351,27 @@ class SupabaseClient {
         }
 
         try {
-            // Total count
-            const { count: totalCount } = await this.client
-                .from('unified_materials')
-                .select('*', { count: 'exact', head: true });
-
-            // EPD count
-            const { count: epdCount } = await this.client
-                .from('unified_materials')
-                .select('*', { count: 'exact', head: true })
-                .eq('source', 'EPD Australasia');
-
-            // Categories count
-            const { data: categories } = await this.client
-                .from('unified_materials')
-                .select('category');
+            // The three stats queries are independent - run them
+            // concurrently instead of three sequential round trips
+            const [
+                { count: totalCount },
+                { count: epdCount },
+                { data: categories }
+            ] = await Promise.all([
+                // Total count
+                this.client
+                    .from('unified_materials')
+                    .select('*', { count: 'exact', head: true }),
+                // EPD count
+                this.client
+                    .from('unified_materials')
+                    .select('*', { count: 'exact', head: true })
+                    .eq('source', 'EPD Australasia'),
+                // Categories count
+                this.client
+                    .from('unified_materials')
+                    .select('category')
+            ]);
 
             const uniqueCategories = [...new Set(categories.map(m => m.category))];
 
@@ -380,11 +412,15 @@ class SupabaseClient {
      */
     getFallbackMaterials() {
         console.log('⚠️ Using fallback materials database (limited to ~40 materials)');
-        
+
+        if (this.fallbackMaterials) {
+            return this.fallbackMaterials;
+        }
+
         // This returns the materials from the existing materials-database.js
         // Convert MATERIALS_DATABASE to array format
         const materials = [];
-        
+
         if (typeof MATERIALS_DATABASE !== 'undefined') {
             Object.entries(MATERIALS_DATABASE).forEach(([categoryKey, categoryData]) => {
                 Object.entries(categoryData.materials).forEach(([materialKey, materialData]) => {
@@ -401,7 +437,8 @@ class SupabaseClient {
                 });
             });
         }
-        
+
+        this.fallbackMaterials = materials;
         return materials;
     }
 
@@ -6,6 +6,58 @@
  */
 
 const { ComprehensiveScopesCalculator, EMISSIONS_FACTORS } = require('../scopes-calculator-comprehensive');
+const { ScopesCalculator } = require('../scopes-calculator');
+
+// Shared immutable inputs - addScope* methods only read from their
+// argument, so tests that don't mutate the input can reuse one object
+// instead of rebuilding the same literal per test
+const STANDARD_EXCAVATOR_100H = Object.freeze({
+    category: 'excavators',
+    type: 'standard_13t',
+    operatingHours: 100
+});
+
+const MINI_EXCAVATOR_50H = Object.freeze({
+    category: 'excavators',
+    type: 'mini_3t',
+    operatingHours: 50
+});
+
+const GENERATOR_100KVA_50H = Object.freeze({
+    category: 'generators',
+    type: '100kVA',
+    operatingHours: 50
+});
+
+// Golden results (tonnes CO2-e) for the standard three-scope project
+// used in the overall tests, pinned once so a single evaluation can be
+// checked against known-good output instead of re-deriving it
+const GOLDEN_STANDARD_PROJECT = Object.freeze({
+    scope1Excavators: 3.216,   // 1200 L diesel * 2.68 kg/L
+    scope2Electricity: 8.1,    // 10000 kWh * 0.81 (NSW)
+    scope3Transport: 9.3,      // 500 t * 30 km * 0.62 kg/t-km
+    total: 20.616
+});
+
+// Loads the standard project (one item per scope) that the overall
+// tests and GOLDEN_STANDARD_PROJECT are built around
+function addStandardProjectItems(calc) {
+    calc.addScope1Equipment(STANDARD_EXCAVATOR_100H);
+
+    calc.addScope2Electricity({
+        description: 'Site power',
+        kWh: 10000,
+        state: 'nsw',
+        days: 30
+    });
+
+    calc.addScope3Transport({
+        material: 'Concrete',
+        weight: 500,
+        distance: 30,
+        transportMode: 'rigidTruck'
+    });
+}
 
 describe('ComprehensiveScopesCalculator', () => {
     let calculator;
@@ -30,11 +82,7 @@ describe('ComprehensiveScopesCalculator', () => {
 
     describe('Scope 1: Direct Emissions', () => {
         test('should add equipment with fuel consumption', () => {
-            const result = calculator.addScope1Equipment({
-                category: 'excavators',
-                type: 'standard_13t',
-                operatingHours: 100
-            });
+            const result = calculator.addScope1Equipment(STANDARD_EXCAVATOR_100H);
 
             expect(result.emissions).toBeGreaterThan(0);
             expect(result.fuelType).toBe('diesel');
@@ -68,10 +116,10 @@ describe('ComprehensiveScopesCalculator', () => {
         });
 
         test('should handle custom fuel rate', () => {
+            // Derive the variant from the shared frozen input rather
+            // than restating the whole literal
             const result = calculator.addScope1Equipment({
-                category: 'generators',
-                type: '100kVA',
-                operatingHours: 50,
+                ...GENERATOR_100KVA_50H,
                 fuelUsed: 1000 // User provided actual fuel
             });
 
@@ -130,6 +178,26 @@ describe('ComprehensiveScopesCalculator', () => {
             expect(result.emissions).toBe(0);
         });
 
+        test('should honour zero grid factors for facilities and equipment', () => {
+            // ACT's 0.0 factor must not fall back to the national
+            // factor in the other two Scope 2 paths either
+            const facility = calculator.addScope2SiteFacility({
+                type: 'siteOffice_large',
+                days: 30,
+                state: 'act'
+            });
+
+            const equipment = calculator.addScope2ElectricEquipment({
+                category: 'hoists',
+                type: 'alimakHoist_single',
+                operatingHours: 100,
+                state: 'act'
+            });
+
+            expect(facility.emissions).toBe(0);
+            expect(equipment.emissions).toBe(0);
+        });
+
         test('should calculate site facility usage', () => {
             const result = calculator.addScope2SiteFacility({
                 type: 'siteOffice_large',
@@ -194,26 +262,19 @@ describe('ComprehensiveScopesCalculator', () => {
             expect(result.emissions).toBeCloseTo(9.3, 2);
         });
 
-        test('should calculate waste landfill emissions', () => {
-            const result = calculator.addScope3Waste({
-                material: 'General waste',
-                weight: 10000, // kg
-                disposalMethod: 'landfill_general'
-            });
-
-            // 10000 kg * 0.94 kg CO2-e/kg = 9400 kg = 9.4 tonnes
-            expect(result.emissions).toBeCloseTo(9.4, 2);
-        });
-
-        test('should calculate recycling emissions (lower than landfill)', () => {
+        // landfill: 10000 kg * 0.94 kg CO2-e/kg = 9400 kg = 9.4 tonnes
+        // recycling: 5000 kg * 0.08 kg CO2-e/kg = 400 kg = 0.4 tonnes
+        test.each([
+            ['landfill_general', 'General waste', 10000, 9.4],
+            ['recycling_metal', 'Metal waste', 5000, 0.4]
+        ])('should calculate %s waste emissions', (disposalMethod, material, weight, expectedTonnes) => {
             const result = calculator.addScope3Waste({
-                material: 'Metal waste',
-                weight: 5000,
-                disposalMethod: 'recycling_metal'
+                material,
+                weight, // kg
+                disposalMethod
             });
 
-            // 5000 * 0.08 = 400 kg = 0.4 tonnes
-            expect(result.emissions).toBeCloseTo(0.4, 2);
+            expect(result.emissions).toBeCloseTo(expectedTonnes, 2);
         });
 
         test('should calculate water emissions', () => {
@@ -278,26 +339,7 @@ describe('ComprehensiveScopesCalculator', () => {
 
     describe('Overall Calculations', () => {
         test('should calculate all scopes with percentages', () => {
-            // Add items to each scope
-            calculator.addScope1Equipment({
-                category: 'excavators',
-                type: 'standard_13t',
-                operatingHours: 100
-            });
-
-            calculator.addScope2Electricity({
-                description: 'Site power',
-                kWh: 10000,
-                state: 'nsw',
-                days: 30
-            });
-
-            calculator.addScope3Transport({
-                material: 'Concrete',
-                weight: 500,
-                distance: 30,
-                transportMode: 'rigidTruck'
-            });
+            addStandardProjectItems(calculator);
 
             const results = calculator.calculateAllScopes();
 
@@ -306,6 +348,12 @@ describe('ComprehensiveScopesCalculator', () => {
             expect(results.scope2.total).toBeGreaterThan(0);
             expect(results.scope3.total).toBeGreaterThan(0);
 
+            // The defining invariant, asserted as one expression: the
+            // grand total is exactly the sum of its three scopes
+            expect(results.total).toBeCloseTo(
+                results.scope1.total + results.scope2.total + results.scope3.total, 10
+            );
+
             // Check percentages add up to 100
             const totalPercentage = parseFloat(results.scope1.percentage) +
                                   parseFloat(results.scope2.percentage) +
@@ -313,13 +361,50 @@ describe('ComprehensiveScopesCalculator', () => {
             expect(totalPercentage).toBeCloseTo(100, 0);
         });
 
-        test('should export data correctly', () => {
-            calculator.addScope1Equipment({
-                category: 'generators',
-                type: '100kVA',
-                operatingHours: 50
+        test('should match the pinned golden results', () => {
+            addStandardProjectItems(calculator);
+
+            const results = calculator.calculateAllScopes();
+
+            expect(results.scope1.breakdown.excavators).toBeCloseTo(GOLDEN_STANDARD_PROJECT.scope1Excavators, 3);
+            expect(results.scope2.breakdown.electricity).toBeCloseTo(GOLDEN_STANDARD_PROJECT.scope2Electricity, 3);
+            expect(results.scope3.breakdown.transport).toBeCloseTo(GOLDEN_STANDARD_PROJECT.scope3Transport, 3);
+            expect(results.total).toBeCloseTo(GOLDEN_STANDARD_PROJECT.total, 3);
+        });
+
+        test('should produce identical results for identical inputs', () => {
+            const other = new ComprehensiveScopesCalculator();
+
+            addStandardProjectItems(calculator);
+            addStandardProjectItems(other);
+
+            const results1 = calculator.calculateAllScopes();
+            const results2 = other.calculateAllScopes();
+
+            // Item ids are randomised, so compare the deterministic
+            // parts structurally instead of field by field
+            expect(results1.total).toBe(results2.total);
+            expect(results1.summary).toEqual(results2.summary);
+            expect(results1.scope1.breakdown).toEqual(results2.scope1.breakdown);
+            expect(results1.scope2.breakdown).toEqual(results2.scope2.breakdown);
+            expect(results1.scope3.breakdown).toEqual(results2.scope3.breakdown);
+
+            // Cheap count check first, so a mismatch fails with the
+            // scope named before the full projection diff is printed
+            ['scope1', 'scope2', 'scope3'].forEach(scope => {
+                expect(results1[scope].items).toHaveLength(results2[scope].items.length);
             });
 
+            // Project each item list onto its deterministic fields and
+            // compare the projections in one shot per scope
+            const stableItems = results => [results.scope1, results.scope2, results.scope3]
+                .map(scope => scope.items.map(item => [item.category, item.type, item.emissions]));
+            expect(stableItems(results1)).toEqual(stableItems(results2));
+        });
+
+        test('should export data correctly', () => {
+            calculator.addScope1Equipment(GENERATOR_100KVA_50H);
+
             const exported = calculator.exportData();
 
             expect(exported).toHaveProperty('scope1');
@@ -331,11 +416,7 @@ describe('ComprehensiveScopesCalculator', () => {
         });
 
         test('should reset calculator correctly', () => {
-            calculator.addScope1Equipment({
-                category: 'excavators',
-                type: 'mini_3t',
-                operatingHours: 50
-            });
+            calculator.addScope1Equipment(MINI_EXCAVATOR_50H);
 
             expect(calculator.scope1Items).toHaveLength(1);
 
@@ -347,17 +428,9 @@ describe('ComprehensiveScopesCalculator', () => {
         });
 
         test('should remove items correctly', () => {
-            const item1 = calculator.addScope1Equipment({
-                category: 'excavators',
-                type: 'mini_3t',
-                operatingHours: 50
-            });
+            const item1 = calculator.addScope1Equipment(MINI_EXCAVATOR_50H);
 
-            const item2 = calculator.addScope1Equipment({
-                category: 'excavators',
-                type: 'standard_13t',
-                operatingHours: 100
-            });
+            const item2 = calculator.addScope1Equipment(STANDARD_EXCAVATOR_100H);
 
             expect(calculator.scope1Items).toHaveLength(2);
 
@@ -419,6 +492,33 @@ describe('ComprehensiveScopesCalculator', () => {
     });
 });
 
+// ============================================================================
+// LEGACY SCOPES CALCULATOR (main calculator page)
+// ============================================================================
+
+describe('ScopesCalculator (legacy)', () => {
+    let legacy;
+
+    beforeEach(() => {
+        legacy = new ScopesCalculator();
+    });
+
+    test('should honour the ACT zero grid factor in Scope 2', () => {
+        const scope2 = legacy.calculateScope2({ electricity: { kwh: 5000 } }, 'act');
+
+        // ACT has 0.0 emissions factor (100% renewable)
+        expect(scope2.categories.electricity).toBe(0);
+        expect(scope2.total).toBe(0);
+    });
+
+    test('should fall back to the national factor only for unknown states', () => {
+        const scope2 = legacy.calculateScope2({ electricity: { kwh: 5000 } }, 'xx');
+
+        // 5000 kWh * 0.81 (national average) = 4050 kg
+        expect(scope2.total).toBeCloseTo(4050, 0);
+    });
+});
+
 // ============================================================================
 // TEST RUNNER (for browser environment)
 // ============================================================================